@@ -3,9 +3,12 @@ Manufacturing Inspection System - Main Entry Point
 Runs 10 inspection cycles with multi-camera parallel processing
 """
 
+import os
 import time
+import queue
 import signal
 import sys
+import threading
 from typing import Dict, Any
 
 from src.core.controller import InspectionController
@@ -22,21 +25,31 @@ from src.utils.metrics import MetricsCollector
 class InspectionSystem:
     """Main system orchestrator for the inspection workflow"""
     
+    PIPELINE_DEPTH = 2  # Inspected cycles allowed to wait for reporting
+    
     def __init__(self):
         self.logger = setup_logger(__name__)
         self.metrics = MetricsCollector()
-        self.running = True
+        # Set on shutdown; also interrupts the wait between cycles
+        self._stop = threading.Event()
+        
+        # INSPECTION_FAST=1 skips simulated hardware latency (throughput/profiling runs)
+        simulate_latency = os.environ.get("INSPECTION_FAST") != "1"
         
         # Initialize components
         self.cameras = [
-            CameraFactory.create_camera("CAM_01", resolution=(1920, 1080)),
-            CameraFactory.create_camera("CAM_02", resolution=(1920, 1080))
+            CameraFactory.create_camera("CAM_01", resolution=(1920, 1080),
+                                        simulate_latency=simulate_latency),
+            CameraFactory.create_camera("CAM_02", resolution=(1920, 1080),
+                                        simulate_latency=simulate_latency)
         ]
         
-        self.preprocessor = Preprocessor()
-        self.inference_engine = InferenceEngine()
+        self.preprocessor = Preprocessor(simulate_latency=simulate_latency)
+        self.inference_engine = InferenceEngine(simulate_latency=simulate_latency)
         self.postprocessor = Postprocessor()
+        self.postprocessor.warmup()
         self.aggregator = ResultAggregator()
+        self.aggregator.warmup()
         self.reporter = InspectionReporter()
         
         self.controller = InspectionController(
@@ -55,31 +68,44 @@ class InspectionSystem:
     def _signal_handler(self, sig, frame):
         """Handle Ctrl+C gracefully"""
         self.logger.info("Shutting down inspection system...")
-        self.running = False
+        self._stop.set()
+        self.controller.close()
         self._print_summary()
         sys.exit(0)
         
-    def run_cycles(self, num_cycles: int = 10):
+    def run_cycles(self, num_cycles: int = 10, inter_cycle_delay_s: float = 0.0):
         """
         Run specified number of inspection cycles
         
         Args:
             num_cycles: Number of inspection cycles to execute
+            inter_cycle_delay_s: Simulated part movement time between triggers
         """
         self.logger.info(f"Starting inspection system - {num_cycles} cycles")
         print(f"\n{'='*60}")
         print(f"  Manufacturing Inspection System - Starting {num_cycles} Cycles")
         print(f"{'='*60}\n")
         
-        for cycle_id in range(1, num_cycles + 1):
-            if not self.running:
+        # Camera work runs ahead on its own thread so the next cycle is
+        # inspected while the current cycle is aggregated and reported
+        inspected = queue.Queue(maxsize=self.PIPELINE_DEPTH)
+        trigger_thread = threading.Thread(
+            target=self._capture_loop,
+            args=(num_cycles, inter_cycle_delay_s, inspected),
+            name="trigger",
+            daemon=True
+        )
+        trigger_thread.start()
+        
+        while not self._stop.is_set():
+            item = inspected.get()
+            if item is None:
                 break
+            cycle_id, camera_results, start_time = item
                 
             try:
-                print(f"[Cycle {cycle_id:02d}/{num_cycles:02d}] Starting inspection...")
-                
-                # Execute inspection cycle
-                report = self.controller.execute_cycle(cycle_id)
+                # Aggregate and report the inspected cycle
+                report = self.controller.complete_cycle(cycle_id, camera_results, start_time)
                 
                 # Display cycle result
                 decision = report['decision']
@@ -87,24 +113,65 @@ class InspectionSystem:
                 color = "\033[92m" if decision == "PASS" else "\033[91m"
                 reset = "\033[0m"
                 
-                print(f"{color}[Cycle {cycle_id:02d}/{num_cycles:02d}] {symbol} {decision}{reset} "
-                      f"- Score: {report['aggregated_score']:.2f} "
-                      f"- Defects: {report['defects_found']} "
-                      f"- Time: {report['total_time_ms']:.0f}ms")
-                
-                # Simulate part movement between cycles
-                if cycle_id < num_cycles:
-                    time.sleep(0.5)
+                self._console_line(f"{color}[Cycle {cycle_id:02d}/{num_cycles:02d}] {symbol} {decision}{reset} "
+                                   f"- Score: {report['aggregated_score']:.2f} "
+                                   f"- Defects: {report['defects_found']} "
+                                   f"- Time: {report['total_time_ms']:.0f}ms")
                     
             except Exception as e:
                 self.logger.error(f"Cycle {cycle_id} failed: {str(e)}")
-                print(f"\033[91m[Cycle {cycle_id:02d}/{num_cycles:02d}] ✗ ERROR\033[0m - {str(e)}")
+                self._console_line(f"\033[91m[Cycle {cycle_id:02d}/{num_cycles:02d}] ✗ ERROR\033[0m - {str(e)}")
                 
+        trigger_thread.join()
+        self.controller.close()
         self._print_summary()
         
+    def _capture_loop(self,
+                      num_cycles: int,
+                      inter_cycle_delay_s: float,
+                      inspected: queue.Queue) -> None:
+        """
+        Trigger cameras for each cycle and hand camera results to the reporting side
+        
+        Args:
+            num_cycles: Number of inspection cycles to trigger
+            inter_cycle_delay_s: Simulated part movement time between triggers
+            inspected: Queue receiving (cycle_id, camera_results, start_time) tuples
+        """
+        try:
+            for cycle_id in range(1, num_cycles + 1):
+                if self._stop.is_set():
+                    break
+                    
+                self._console_line(f"[Cycle {cycle_id:02d}/{num_cycles:02d}] Starting inspection...")
+                
+                start_time = time.time()
+                camera_results = self.controller.inspect_cameras(cycle_id)
+                inspected.put((cycle_id, camera_results, start_time))
+                
+                # Part movement; shutdown cuts the wait short
+                if inter_cycle_delay_s > 0 and cycle_id < num_cycles:
+                    self._stop.wait(inter_cycle_delay_s)
+                    
+        except Exception as e:
+            self.logger.error(f"Capture loop stopped: {str(e)}")
+            
+        inspected.put(None)
+            
+    def _console_line(self, line: str) -> None:
+        """
+        Write one line to stdout with a single write call.
+        
+        The trigger and reporting threads both print while loggers write to
+        the same stream; print() emits the text and the newline separately,
+        so their output could interleave mid-line.
+        """
+        sys.stdout.write(f"{line}\n")
+        
     def _print_summary(self):
         """Print final summary statistics"""
         stats = self.metrics.get_summary()
+        recent = self.metrics.get_recent_summary()
         
         print(f"\n{'='*60}")
         print(f"  INSPECTION SUMMARY")
@@ -114,6 +181,9 @@ class InspectionSystem:
         print(f"Failed:              {stats['failed_cycles']}")
         print(f"Pass Rate:           {stats['pass_rate']:.1f}%")
         print(f"Average Cycle Time:  {stats['avg_cycle_time']:.0f}ms")
+        print(f"Recent Cycle Time:   {recent['avg_cycle_time']:.0f}ms "
+              f"(min {recent['min_cycle_time']:.0f}ms, max {recent['max_cycle_time']:.0f}ms, "
+              f"last {recent['window_cycles']} cycles)")
         print(f"Total Defects:       {stats['total_defects']}")
         print(f"Camera Failures:     {stats['camera_failures']}")
         print(f"{'='*60}\n")
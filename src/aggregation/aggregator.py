@@ -2,22 +2,42 @@
 Result Aggregator - Combines multi-camera results
 """
 
+from array import array
+from collections import Counter
+from enum import IntEnum
 from typing import Dict, Any, List
 
+from src.processing._kernels import severity_histogram
+from src.processing.defects import Severity
+from src.processing.postprocessor import CameraResult
+from src.utils.jit import HAS_NUMBA
 from src.utils.logger import setup_logger
 
 
+class Decision(IntEnum):
+    """Overall inspection outcome for a part"""
+    PASS = 0
+    FAIL = 1
+
+
 class ResultAggregator:
     """
     Aggregates results from multiple cameras into unified assessment.
     """
     
     PASS_THRESHOLD = 0.75  # Minimum score to pass inspection
+    # Below this many detections the kernel call costs more than it saves
+    KERNEL_MIN_DETECTIONS = 64
     
     def __init__(self):
         self.logger = setup_logger(__name__)
         
-    def aggregate(self, camera_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    def warmup(self) -> None:
+        """Run the severity kernel once so JIT compilation stays out of the cycles"""
+        if HAS_NUMBA:
+            self._run_kernel(array("b", [0]))
+            
+    def aggregate(self, camera_results: Dict[str, CameraResult]) -> Dict[str, Any]:
         """
         Aggregate results from all cameras.
         
@@ -30,22 +50,37 @@ class ResultAggregator:
         if not camera_results:
             raise ValueError("No camera results to aggregate")
             
-        # Extract scores and detections
+        # Extract scores and per-camera severity histograms
         scores = []
-        all_detections = []
         camera_summaries = {}
+        severity_counts = [0] * len(Severity)
+        total_defects = 0
+        trigger_timestamp = None
         
         for camera_id, result in camera_results.items():
-            score = result.get("quality_score", 0.0)
-            detections = result.get("detections", [])
+            score = result.quality_score
+            severity_idx = result.detections["severity_idx"]
+            defects = len(severity_idx)
+            severities = self._count_severities(severity_idx)
             
             scores.append(score)
-            all_detections.extend(detections)
+            total_defects += defects
             
+            # Cameras share one shutter stamp; an unsynchronized camera
+            # stamps its own, so keep the earliest
+            if result.trigger_timestamp is not None and (
+                    trigger_timestamp is None or result.trigger_timestamp < trigger_timestamp):
+                trigger_timestamp = result.trigger_timestamp
+                
+            # Totals are summed from the per-camera histograms rather than
+            # re-counting every detection
+            for level, count in enumerate(severities):
+                severity_counts[level] += count
+                
             camera_summaries[camera_id] = {
                 "score": score,
-                "defects": len(detections),
-                "severities": self._count_severities(detections)
+                "defects": defects,
+                "severities": severities
             }
             
         # Calculate aggregated score (using minimum - strictest)
@@ -53,23 +88,21 @@ class ResultAggregator:
         aggregated_score = self._calculate_aggregated_score(scores)
         
         # Make pass/fail decision
-        decision = "PASS" if aggregated_score >= self.PASS_THRESHOLD else "FAIL"
-        
-        # Count total defects by severity
-        severity_counts = self._count_severities(all_detections)
+        decision = Decision.PASS if aggregated_score >= self.PASS_THRESHOLD else Decision.FAIL
         
         result = {
             "aggregated_score": round(aggregated_score, 3),
             "decision": decision,
             "camera_summaries": camera_summaries,
-            "total_defects": len(all_detections),
+            "total_defects": total_defects,
             "severity_counts": severity_counts,
-            "cameras_used": len(camera_results)
+            "cameras_used": len(camera_results),
+            "trigger_timestamp": trigger_timestamp
         }
         
-        self.logger.debug(f"Aggregated {len(camera_results)} cameras: "
-                         f"{decision} (Score: {aggregated_score:.2f})")
-        
+        self.logger.debug("Aggregated %d cameras: %s (Score: %.2f)",
+                          len(camera_results), decision.name, aggregated_score)
+                          
         return result
         
     def _calculate_aggregated_score(self, scores: List[float]) -> float:
@@ -90,21 +123,33 @@ class ResultAggregator:
         # Could also use: average, weighted average, etc.
         return min(scores)
         
-    def _count_severities(self, detections: List[Dict[str, Any]]) -> Dict[str, int]:
+    def _count_severities(self, severity_idx: array) -> List[int]:
         """
         Count detections by severity level.
         
         Args:
-            detections: List of detection dictionaries
+            severity_idx: Severity column of a classified detection batch
             
         Returns:
-            Dictionary of severity counts
+            Severity counts indexed by Severity value
         """
-        counts = {"minor": 0, "major": 0, "critical": 0}
+        if HAS_NUMBA and len(severity_idx) >= self.KERNEL_MIN_DETECTIONS:
+            return self._run_kernel(severity_idx)
+            
+        # Counter tallies the severity_idx array in C
+        tally = Counter(severity_idx)
+        return [tally[level] for level in Severity]
         
-        for det in detections:
-            severity = det.get("severity", "minor")
-            if severity in counts:
-                counts[severity] += 1
-                
-        return counts
\ No newline at end of file
+    def _run_kernel(self, severity_idx: array) -> List[int]:
+        """
+        Count detections by severity level with the compiled kernel.
+        
+        Args:
+            severity_idx: Severity column of a classified detection batch
+            
+        Returns:
+            Severity counts indexed by Severity value
+        """
+        counts = array("q", bytes(8 * len(Severity)))
+        severity_histogram(memoryview(severity_idx), memoryview(counts))
+        return counts.tolist()
\ No newline at end of file
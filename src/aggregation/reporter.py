@@ -2,9 +2,11 @@
 Inspection Reporter - Generates unified inspection reports
 """
 
-from datetime import datetime
 from typing import Dict, Any
 
+from src.processing.defects import DEFECT_CLASS_NAMES, SEVERITY_NAMES
+from src.processing.postprocessor import CameraResult
+from src.utils.clock import iso_utc_now
 from src.utils.logger import setup_logger
 
 
@@ -16,50 +18,31 @@ class InspectionReporter:
     def __init__(self):
         self.logger = setup_logger(__name__)
         
-    def generate_report(self, 
-                       cycle_id: int,
-                       camera_results: Dict[str, Dict[str, Any]],
-                       aggregated_result: Dict[str, Any],
-                       total_time_ms: float) -> Dict[str, Any]:
+    def generate_summary_report(self,
+                                cycle_id: int,
+                                aggregated_result: Dict[str, Any],
+                                total_time_ms: float) -> Dict[str, Any]:
         """
-        Generate comprehensive inspection report.
+        Generate the per-cycle inspection report without per-camera detail.
         
         Args:
             cycle_id: Inspection cycle identifier
-            camera_results: Raw results from each camera
             aggregated_result: Aggregated assessment
             total_time_ms: Total cycle execution time
             
         Returns:
-            Complete inspection report
+            Summary inspection report
         """
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = iso_utc_now()
         
-        # Build camera detail section
-        camera_details = {}
-        for camera_id, result in camera_results.items():
-            camera_details[camera_id] = {
-                "quality_score": result.get("quality_score", 0.0),
-                "defects_found": len(result.get("detections", [])),
-                "processing_time_ms": result.get("pipeline_time_ms", 0.0),
-                "defect_details": [
-                    {
-                        "type": det["class"],
-                        "severity": det["severity"],
-                        "confidence": det["confidence"]
-                    }
-                    for det in result.get("detections", [])
-                ]
-            }
-            
         report = {
             "cycle_id": cycle_id,
             "timestamp": timestamp,
-            "cameras": camera_details,
+            "trigger_timestamp": aggregated_result["trigger_timestamp"],
             "aggregated_score": aggregated_result["aggregated_score"],
-            "decision": aggregated_result["decision"],
+            "decision": aggregated_result["decision"].name,
             "defects_found": aggregated_result["total_defects"],
-            "severity_breakdown": aggregated_result["severity_counts"],
+            "severity_breakdown": dict(zip(SEVERITY_NAMES, aggregated_result["severity_counts"])),
             "total_time_ms": round(total_time_ms, 2),
             "cameras_used": aggregated_result["cameras_used"]
         }
@@ -74,12 +57,56 @@ class InspectionReporter:
         
         return report
         
+    def generate_full_report(self,
+                             report: Dict[str, Any],
+                             camera_results: Dict[str, CameraResult]) -> Dict[str, Any]:
+        """
+        Extend a summary report with per-camera defect details.
+        
+        Only built when a consumer needs the detail (e.g. a failed part
+        going to review), since it formats a row for every detection.
+        
+        Args:
+            report: Report returned by generate_summary_report
+            camera_results: Raw results from each camera
+            
+        Returns:
+            Complete inspection report
+        """
+        camera_details = {}
+        
+        for camera_id, result in camera_results.items():
+            detections = result.detections
+            severity_idx = detections["severity_idx"]
+            camera_details[camera_id] = {
+                "quality_score": round(result.quality_score, 3),
+                "defects_found": len(severity_idx),
+                "processing_time_ms": result.pipeline_time_ms,
+                "defect_details": [
+                    {
+                        "type": DEFECT_CLASS_NAMES[class_idx],
+                        "severity": SEVERITY_NAMES[severity_idx],
+                        "confidence": round(confidence, 3)
+                    }
+                    for class_idx, severity_idx, confidence in zip(
+                        detections["class_idx"],
+                        severity_idx,
+                        detections["confidence"]
+                    )
+                ]
+            }
+            
+        full_report = dict(report)
+        full_report["cameras"] = camera_details
+        
+        return full_report
+        
     def format_report_text(self, report: Dict[str, Any]) -> str:
         """
         Format report as human-readable text.
         
         Args:
-            report: Report dictionary
+            report: Report dictionary (camera section only for full reports)
             
         Returns:
             Formatted text report
@@ -89,6 +116,7 @@ class InspectionReporter:
             f"  INSPECTION REPORT - Cycle #{report['cycle_id']}",
             f"═══════════════════════════════════════════",
             f"Timestamp:     {report['timestamp']}",
+            f"Triggered:     {report['trigger_timestamp']}",
             f"Decision:      {report['decision']}",
             f"Score:         {report['aggregated_score']:.2f}",
             f"Total Time:    {report['total_time_ms']:.0f}ms",
@@ -102,15 +130,16 @@ class InspectionReporter:
             lines.append(f"  - Major:     {severity.get('major', 0)}")
             lines.append(f"  - Minor:     {severity.get('minor', 0)}")
             
-        lines.append(f"")
-        lines.append(f"Camera Results:")
-        
-        for camera_id, details in report['cameras'].items():
-            lines.append(f"  {camera_id}:")
-            lines.append(f"    Score:   {details['quality_score']:.2f}")
-            lines.append(f"    Defects: {details['defects_found']}")
-            lines.append(f"    Time:    {details['processing_time_ms']:.0f}ms")
+        if 'cameras' in report:
+            lines.append(f"")
+            lines.append(f"Camera Results:")
             
+            for camera_id, details in report['cameras'].items():
+                lines.append(f"  {camera_id}:")
+                lines.append(f"    Score:   {details['quality_score']:.2f}")
+                lines.append(f"    Defects: {details['defects_found']}")
+                lines.append(f"    Time:    {details['processing_time_ms']:.0f}ms")
+                
         lines.append(f"═══════════════════════════════════════════")
         
         return "\n".join(lines)
\ No newline at end of file
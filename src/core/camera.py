@@ -4,12 +4,28 @@ Camera Interface - Mock camera implementation
 
 import time
 import random
-from datetime import datetime
-from typing import Dict, Any, Tuple
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
 
+from src.utils.clock import iso_utc_now
 from src.utils.logger import setup_logger
 
 
+@dataclass
+class Frame:
+    """Raw frame captured by a camera"""
+    __slots__ = ("camera_id", "timestamp", "frame_number", "resolution",
+                 "frame_data", "metadata", "trigger_timestamp")
+    
+    camera_id: str
+    timestamp: str
+    frame_number: int
+    resolution: Tuple[int, int]
+    frame_data: str
+    metadata: Dict[str, float]
+    trigger_timestamp: Optional[str]  # Set by the controller at the shutter
+
+
 class Camera:
     """
     Mock camera implementation simulating frame capture.
@@ -18,29 +34,42 @@ class Camera:
     
     CAPTURE_LATENCY_RANGE = (0.05, 0.15)  # 50-150ms
     FAILURE_RATE = 0.05  # 5% chance of capture failure
+    REARM_LATENCY = 0.02  # 20ms to re-arm the sensor after a failure
     
-    def __init__(self, camera_id: str, resolution: Tuple[int, int] = (1920, 1080)):
+    def __init__(self, camera_id: str, resolution: Tuple[int, int] = (1920, 1080),
+                 simulate_latency: bool = True):
         self.camera_id = camera_id
         self.resolution = resolution
+        # Resolution is fixed for the camera's lifetime, so the frame
+        # payload placeholder is built once
+        self._frame_data_str = f"<mock_image_data_{resolution[0]}x{resolution[1]}>"
+        self.simulate_latency = simulate_latency
         self.logger = setup_logger(f"{__name__}.{camera_id}")
         self.frame_count = 0
+        self.armed = True
+        self._rng = random.Random()
         
-    def capture(self) -> Dict[str, Any]:
+    def capture(self) -> Frame:
         """
         Capture a frame from the camera.
         
         Returns:
-            Frame data dictionary
+            Captured frame
             
         Raises:
-            RuntimeError: If capture fails
+            RuntimeError: If capture fails or the sensor has not been re-armed
         """
+        if not self.armed:
+            raise RuntimeError(f"{self.camera_id}: Capture failed - sensor not armed")
+            
         # Simulate capture latency
-        latency = random.uniform(*self.CAPTURE_LATENCY_RANGE)
-        time.sleep(latency)
+        latency = self._rng.uniform(*self.CAPTURE_LATENCY_RANGE)
+        if self.simulate_latency:
+            time.sleep(latency)
         
         # Simulate occasional failures
-        if random.random() < self.FAILURE_RATE:
+        if self._rng.random() < self.FAILURE_RATE:
+            self.armed = False
             raise RuntimeError(f"{self.camera_id}: Capture failed - sensor timeout")
             
         self.frame_count += 1
@@ -48,29 +77,38 @@ class Camera:
         # Generate mock frame data
         frame_data = self._generate_mock_frame()
         
-        self.logger.debug(f"Captured frame #{self.frame_count} ({latency*1000:.0f}ms)")
+        self.logger.debug("Captured frame #%d (%.0fms)", self.frame_count, latency * 1000)
         
         return frame_data
         
-    def _generate_mock_frame(self) -> Dict[str, Any]:
+    def rearm(self) -> None:
+        """Re-arm the sensor after a failed capture"""
+        if self.simulate_latency:
+            time.sleep(self.REARM_LATENCY)
+        self.armed = True
+        
+    def _generate_mock_frame(self) -> Frame:
         """
         Generate mock frame data.
         
         Returns:
             Frame data structure
         """
-        return {
-            "camera_id": self.camera_id,
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "frame_number": self.frame_count,
-            "resolution": self.resolution,
-            "frame_data": f"<mock_image_data_{self.resolution[0]}x{self.resolution[1]}>",
-            "metadata": {
-                "exposure_ms": random.uniform(8, 12),
-                "gain": random.uniform(1.0, 2.0),
-                "temperature_c": random.uniform(35, 45)
-            }
-        }
+        uniform = self._rng.uniform
+        
+        return Frame(
+            camera_id=self.camera_id,
+            timestamp=iso_utc_now(),
+            frame_number=self.frame_count,
+            resolution=self.resolution,
+            frame_data=self._frame_data_str,
+            metadata={
+                "exposure_ms": uniform(8, 12),
+                "gain": uniform(1.0, 2.0),
+                "temperature_c": uniform(35, 45)
+            },
+            trigger_timestamp=None
+        )
         
     def get_info(self) -> Dict[str, Any]:
         """Get camera information"""
@@ -85,15 +123,17 @@ class CameraFactory:
     """Factory for creating camera instances"""
     
     @staticmethod
-    def create_camera(camera_id: str, resolution: Tuple[int, int] = (1920, 1080)) -> Camera:
+    def create_camera(camera_id: str, resolution: Tuple[int, int] = (1920, 1080),
+                      simulate_latency: bool = True) -> Camera:
         """
         Create a camera instance.
         
         Args:
             camera_id: Unique camera identifier
             resolution: Camera resolution (width, height)
+            simulate_latency: Sleep to mimic real capture latency
             
         Returns:
             Camera instance
         """
-        return Camera(camera_id, resolution)
\ No newline at end of file
+        return Camera(camera_id, resolution, simulate_latency)
\ No newline at end of file
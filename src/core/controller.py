@@ -5,8 +5,12 @@ Inspection Controller - Orchestrates the inspection workflow
 import time
 import threading
 from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
 
+from src.core.camera import Camera, Frame
+from src.core.health import CameraHealthMonitor
+from src.processing.postprocessor import CameraResult
+from src.utils.clock import iso_utc_now
 from src.utils.logger import setup_logger
 
 
@@ -17,6 +21,8 @@ class InspectionController:
     """
     
     MAX_CYCLE_TIMEOUT = 5.0  # seconds
+    SHUTTER_TIMEOUT = 0.5  # seconds to wait for all cameras at the trigger
+    BATCH_TIMEOUT = 1.0  # seconds to wait for all cameras to reach inference
     
     def __init__(self, cameras, preprocessor, inference_engine, 
                  postprocessor, aggregator, reporter, metrics):
@@ -29,6 +35,39 @@ class InspectionController:
         self.metrics = metrics
         self.logger = setup_logger(__name__)
         
+        for camera in cameras:
+            self.metrics.register_camera(camera.camera_id)
+        
+        # Long-lived worker pool reused across cycles, one worker per camera
+        self._pool = ThreadPoolExecutor(max_workers=len(cameras),
+                                        thread_name_prefix="cam")
+        
+        # All camera tasks meet here so the shutters fire together; the
+        # barrier action stamps one trigger timestamp for the whole cycle
+        self._trigger_timestamp = None
+        self._shutter = threading.Barrier(len(cameras), action=self._stamp_trigger)
+        
+        # Camera tasks meet again before inference; the last one to arrive
+        # runs a single batched inference for every preprocessed frame
+        self._batch_inputs = {}
+        self._batch_outputs = {}
+        self._batch = threading.Barrier(len(cameras), action=self._run_batch_inference)
+        
+        # Failed cameras are recovered in the background, not mid-cycle
+        self._health_monitor = CameraHealthMonitor()
+        self._health_monitor.start()
+        
+    def __enter__(self) -> "InspectionController":
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+        
+    def close(self) -> None:
+        """Shut down the camera worker pool and health monitor"""
+        self._pool.shutdown(wait=True)
+        self._health_monitor.stop()
+        
     def execute_cycle(self, cycle_id: int) -> Dict[str, Any]:
         """
         Execute a complete inspection cycle.
@@ -40,32 +79,95 @@ class InspectionController:
             Inspection report dictionary
         """
         start_time = time.time()
+        camera_results = self.inspect_cameras(cycle_id)
+        return self.complete_cycle(cycle_id, camera_results, start_time)
         
-        try:
-            # Step 1: Trigger and parallel capture
-            self.logger.info(f"Cycle {cycle_id}: Triggering cameras")
-            frames = self._parallel_capture()
+    def inspect_cameras(self, cycle_id: int) -> Dict[str, CameraResult]:
+        """
+        Trigger all cameras and run each camera's processing pipeline.
+        
+        Each camera's pipeline runs as one task on the worker pool; the
+        tasks rendezvous once so inference runs as a single batch.
+        
+        Args:
+            cycle_id: Unique identifier for this cycle
+            
+        Returns:
+            Dictionary mapping camera_id to processing results
+        """
+        self.logger.info(f"Cycle {cycle_id}: Triggering cameras")
+        
+        deadline = time.time() + self.MAX_CYCLE_TIMEOUT
+        futures = [self._pool.submit(self._full_camera_pipeline, camera)
+                   for camera in self.cameras]
+        
+        # Results come back in camera order; failed cameras yield None
+        results = {}
+        timed_out = False
+        for camera, future in zip(self.cameras, futures):
+            try:
+                result = future.result(timeout=max(0.0, deadline - time.time()))
+            except FutureTimeoutError:
+                timed_out = True
+                continue
+            if result is not None:
+                results[camera.camera_id] = result
+                
+        if timed_out:
+            self.logger.error(f"Cycle {cycle_id}: Cameras timed out after "
+                              f"{self.MAX_CYCLE_TIMEOUT:.0f}s")
+            # A timed-out task is still running and would otherwise join the
+            # next cycle's barriers with this cycle's frame: release anyone
+            # waiting at a barrier and let the stragglers finish first
+            self._shutter.abort()
+            self._batch.abort()
+            wait(futures)
             
-            if not frames:
-                raise Exception("No frames captured from any camera")
+        # A camera task that never reached a rendezvous leaves that barrier
+        # broken; re-arm it now that no task is running
+        if self._shutter.broken:
+            self._shutter.reset()
+        if self._batch.broken:
+            self._batch_inputs = {}
+            self._batch.reset()
             
-            # Step 2: Per-camera processing pipeline
-            self.logger.info(f"Cycle {cycle_id}: Processing {len(frames)} camera frames")
-            camera_results = self._process_frames(frames)
+        return results
+        
+    def complete_cycle(self,
+                       cycle_id: int,
+                       camera_results: Dict[str, CameraResult],
+                       start_time: float) -> Dict[str, Any]:
+        """
+        Aggregate camera results and generate the cycle report.
+        
+        Args:
+            cycle_id: Unique identifier for this cycle
+            camera_results: Results returned by inspect_cameras
+            start_time: time.time() at which the cycle was triggered
+            
+        Returns:
+            Inspection report dictionary
+        """
+        try:
+            if not camera_results:
+                raise Exception("No results from any camera")
             
-            # Step 3: Aggregate results
+            # Aggregate results
             self.logger.info(f"Cycle {cycle_id}: Aggregating results")
             aggregated = self.aggregator.aggregate(camera_results)
             
-            # Step 4: Generate report
+            # Generate report
             elapsed_ms = (time.time() - start_time) * 1000
-            report = self.reporter.generate_report(
+            report = self.reporter.generate_summary_report(
                 cycle_id=cycle_id,
-                camera_results=camera_results,
                 aggregated_result=aggregated,
                 total_time_ms=elapsed_ms
             )
             
+            # Per-camera defect detail is only needed to review failed parts
+            if report['decision'] == "FAIL":
+                report = self.reporter.generate_full_report(report, camera_results)
+            
             # Record metrics
             self.metrics.record_cycle(report)
             
@@ -79,110 +181,130 @@ class InspectionController:
             self.metrics.record_failure()
             raise
             
-    def _parallel_capture(self) -> Dict[str, Dict[str, Any]]:
-        """
-        Capture frames from all cameras in parallel.
-        
-        Returns:
-            Dictionary mapping camera_id to frame data
-        """
-        frames = {}
-        
-        with ThreadPoolExecutor(max_workers=len(self.cameras)) as executor:
-            # Submit capture tasks
-            future_to_camera = {
-                executor.submit(self._capture_with_retry, camera): camera
-                for camera in self.cameras
-            }
-            
-            # Collect results
-            for future in as_completed(future_to_camera):
-                camera = future_to_camera[future]
-                try:
-                    frame = future.result(timeout=self.MAX_CYCLE_TIMEOUT)
-                    if frame:
-                        frames[camera.camera_id] = frame
-                        self.logger.debug(f"Captured frame from {camera.camera_id}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to capture from {camera.camera_id}: {str(e)}")
-                    self.metrics.record_camera_failure(camera.camera_id)
-                    
-        return frames
-        
-    def _capture_with_retry(self, camera, max_retries: int = 3) -> Optional[Dict[str, Any]]:
+    def _full_camera_pipeline(self, camera: Camera) -> Optional[CameraResult]:
         """
-        Attempt to capture frame with retry logic.
+        Capture, preprocess, infer and post-process one camera's frame.
         
         Args:
             camera: Camera object
-            max_retries: Maximum number of retry attempts
             
         Returns:
-            Frame data or None if all retries failed
+            Processing result or None if any step failed
         """
-        for attempt in range(max_retries):
+        frame = self._capture_frame(camera)
+        
+        preprocessed = None
+        if frame is not None:
+            self.logger.debug("Captured frame from %s", camera.camera_id)
+            preprocess_start = time.perf_counter()
             try:
-                frame = camera.capture()
-                return frame
+                preprocessed = self.preprocessor.process(frame)
+                own_time = time.perf_counter() - preprocess_start
             except Exception as e:
-                if attempt < max_retries - 1:
-                    self.logger.debug(f"{camera.camera_id}: Retry {attempt + 1}/{max_retries}")
-                    time.sleep(0.05)  # Small delay between retries
-                else:
-                    self.logger.error(f"{camera.camera_id}: All retries failed")
-                    return None
-                    
-    def _process_frames(self, frames: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
-        """
-        Process each frame through the complete pipeline.
+                self.logger.error(f"Processing failed for {camera.camera_id}: {str(e)}")
+                
+        # Every task joins the inference batch, even without a frame, so the
+        # rendezvous never waits on a camera that has already failed
+        inference_result = self._batched_infer(camera.camera_id, preprocessed)
         
-        Args:
-            frames: Dictionary of camera_id to frame data
+        if inference_result is None:
+            return None
             
-        Returns:
-            Dictionary of camera_id to processing results
-        """
-        results = {}
+        postprocess_start = time.perf_counter()
+        try:
+            result = self.postprocessor.process(inference_result, camera.camera_id)
+        except Exception as e:
+            self.logger.error(f"Processing failed for {camera.camera_id}: {str(e)}")
+            # Continue with other cameras
+            return None
+            
+        # Only this camera's own stages: the batch wait and the shared
+        # inference call would otherwise mostly measure the other cameras
+        own_time += time.perf_counter() - postprocess_start
+        result.pipeline_time_ms = own_time * 1000
         
-        with ThreadPoolExecutor(max_workers=len(frames)) as executor:
-            future_to_camera = {
-                executor.submit(self._process_single_frame, camera_id, frame): camera_id
-                for camera_id, frame in frames.items()
-            }
-            
-            for future in as_completed(future_to_camera):
-                camera_id = future_to_camera[future]
-                try:
-                    result = future.result()
-                    results[camera_id] = result
-                except Exception as e:
-                    self.logger.error(f"Processing failed for {camera_id}: {str(e)}")
-                    # Continue with other cameras
-                    
-        return results
+        return result
         
-    def _process_single_frame(self, camera_id: str, frame: Dict[str, Any]) -> Dict[str, Any]:
+    def _batched_infer(self,
+                       camera_id: str,
+                       preprocessed: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """
-        Process a single frame through the complete pipeline.
+        Contribute a frame to this cycle's inference batch and wait for it.
+        
+        If the batch cannot be assembled in time the frame is inferred alone.
         
         Args:
             camera_id: Camera identifier
-            frame: Frame data
+            preprocessed: Preprocessed frame, or None if the camera failed
             
         Returns:
-            Processing result
+            Inference result for this camera, or None
         """
-        pipeline_start = time.time()
+        if preprocessed is not None:
+            self._batch_inputs[camera_id] = preprocessed
+            
+        try:
+            self._batch.wait(timeout=self.BATCH_TIMEOUT)
+        except threading.BrokenBarrierError:
+            if preprocessed is None:
+                return None
+            self.logger.warning(f"{camera_id}: Inference batch not assembled, inferring alone")
+            try:
+                return self.inference_engine.infer(preprocessed, camera_id)
+            except Exception as e:
+                self.logger.error(f"Processing failed for {camera_id}: {str(e)}")
+                return None
+                
+        return self._batch_outputs.get(camera_id)
         
-        # Preprocess
-        preprocessed = self.preprocessor.process(frame)
+    def _run_batch_inference(self) -> None:
+        """Barrier action: run one inference call over all submitted frames"""
+        batch, self._batch_inputs = self._batch_inputs, {}
+        self._batch_outputs = {}
         
-        # Inference
-        detections = self.inference_engine.infer(preprocessed, camera_id)
+        if not batch:
+            return
+            
+        try:
+            inference_results = self.inference_engine.infer_batch(
+                list(batch.values()), list(batch)
+            )
+        except Exception as e:
+            self.logger.error(f"Batch inference failed: {str(e)}")
+            return
+            
+        self._batch_outputs = dict(zip(batch, inference_results))
+        
+    def _stamp_trigger(self) -> None:
+        """Barrier action: record the trigger time shared by all cameras"""
+        self._trigger_timestamp = iso_utc_now()
         
-        # Post-process
-        result = self.postprocessor.process(detections, camera_id)
+    def _capture_frame(self, camera: Camera) -> Optional[Frame]:
+        """
+        Capture a frame, dropping the camera from this cycle on failure.
         
-        result['pipeline_time_ms'] = (time.time() - pipeline_start) * 1000
+        Waits at the shutter barrier first so every camera captures at the
+        same instant; if a camera is late the capture proceeds unsynchronized.
         
-        return result
\ No newline at end of file
+        Args:
+            camera: Camera object
+            
+        Returns:
+            Frame data or None if capture failed
+        """
+        try:
+            self._shutter.wait(timeout=self.SHUTTER_TIMEOUT)
+            trigger_timestamp = self._trigger_timestamp
+        except threading.BrokenBarrierError:
+            self.logger.warning(f"{camera.camera_id}: Trigger not synchronized")
+            trigger_timestamp = iso_utc_now()
+            
+        try:
+            frame = camera.capture()
+            frame.trigger_timestamp = trigger_timestamp
+            return frame
+        except Exception as e:
+            self.logger.warning(f"Failed to capture from {camera.camera_id}: {str(e)}")
+            self.metrics.record_camera_failure(camera.camera_id)
+            self._health_monitor.report_failure(camera)
+            return None
\ No newline at end of file
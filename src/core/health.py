@@ -0,0 +1,73 @@
+"""
+Camera Health Monitor - Background recovery of failed cameras
+"""
+
+import threading
+from typing import Dict
+
+from src.utils.logger import setup_logger
+
+
+class CameraHealthMonitor:
+    """
+    Re-arms cameras that failed a capture, off the inspection critical path.
+    
+    The controller drops a failed frame immediately and reports the camera
+    here; a background thread recovers it before the next trigger.
+    """
+    
+    RETRY_INTERVAL = 0.1  # seconds between attempts for cameras still failing
+    
+    def __init__(self):
+        self.logger = setup_logger(__name__)
+        self._lock = threading.Lock()
+        self._failed: Dict[str, object] = {}
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="camera-health", daemon=True)
+        
+    def start(self) -> None:
+        """Start the background recovery thread"""
+        self._thread.start()
+        
+    def stop(self) -> None:
+        """Stop the background recovery thread"""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread.is_alive():
+            self._thread.join()
+            
+    def report_failure(self, camera) -> None:
+        """
+        Queue a camera for recovery.
+        
+        Args:
+            camera: Camera whose last capture failed
+        """
+        with self._lock:
+            self._failed[camera.camera_id] = camera
+        self._wake.set()
+        
+    def _run(self) -> None:
+        """Recovery loop: sleep until a failure is reported, retry every RETRY_INTERVAL"""
+        while not self._stopped.is_set():
+            # Idle without a timeout; poll only while a retry is pending
+            with self._lock:
+                timeout = self.RETRY_INTERVAL if self._failed else None
+            self._wake.wait(timeout)
+            self._wake.clear()
+            
+            # Take ownership of pending cameras; failures reported while we
+            # recover land in a fresh dict and are handled next round
+            with self._lock:
+                pending, self._failed = self._failed, {}
+                
+            for camera_id, camera in pending.items():
+                try:
+                    camera.rearm()
+                    self.logger.info(f"{camera_id}: Recovered")
+                except Exception as e:
+                    self.logger.warning(f"{camera_id}: Recovery failed: {str(e)}")
+                    # Requeue without waking so the retry waits RETRY_INTERVAL
+                    with self._lock:
+                        self._failed.setdefault(camera_id, camera)
\ No newline at end of file
@@ -2,11 +2,64 @@
 Inspector - Pipeline manager for inspection workflow
 """
 
-from typing import Dict, Any
+import queue
+import threading
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, Optional
 
+from src.core.camera import Frame
+from src.processing.postprocessor import CameraResult
 from src.utils.logger import setup_logger
 
 
+class PipelineStage:
+    """
+    Runs one processing step on its own thread between two one-slot queues.
+    
+    Chained stages overlap: while one stage works on frame N the previous
+    stage is already on frame N+1, so a stream's throughput is bounded by
+    the slowest stage rather than the sum of all stages. Items are handed
+    over by reference.
+    """
+    
+    STOP = object()  # End-of-stream marker, forwarded down the chain
+    
+    def __init__(self, name: str, step: Callable[[Any], Any],
+                 input: Optional[queue.Queue] = None):
+        self.name = name
+        self.step = step
+        self.input = input if input is not None else queue.Queue(maxsize=1)
+        self.output = queue.Queue(maxsize=1)
+        self.logger = setup_logger(f"{__name__}.{name}")
+        self._thread = threading.Thread(target=self._run, name=f"stage-{name}", daemon=True)
+        
+    def start(self) -> None:
+        """Start the stage worker thread"""
+        self._thread.start()
+        
+    def join(self) -> None:
+        """Wait for the stage to drain after STOP"""
+        self._thread.join()
+        
+    def _run(self) -> None:
+        """Worker loop: apply the step to each input until STOP arrives"""
+        while True:
+            item = self.input.get()
+            
+            if item is self.STOP:
+                self.output.put(self.STOP)
+                return
+                
+            try:
+                result = self.step(item)
+            except Exception as e:
+                self.logger.error(f"Stage {self.name} failed: {str(e)}")
+                # Drop the item and keep the stream moving
+                continue
+                
+            self.output.put(result)
+
+
 class InspectionPipeline:
     """
     Manages the complete inspection pipeline for a single camera.
@@ -20,7 +73,7 @@ class InspectionPipeline:
         self.postprocessor = postprocessor
         self.logger = setup_logger(f"{__name__}.{camera_id}")
         
-    def process(self, frame: Dict[str, Any]) -> Dict[str, Any]:
+    def process(self, frame: Frame) -> CameraResult:
         """
         Process a frame through the complete pipeline.
         
@@ -30,7 +83,7 @@ class InspectionPipeline:
         Returns:
             Processing results including detections and quality score
         """
-        self.logger.debug(f"Starting pipeline for frame {frame.get('frame_number')}")
+        self.logger.debug("Starting pipeline for frame %d", frame.frame_number)
         
         # Step 1: Preprocess
         preprocessed = self.preprocessor.process(frame)
@@ -41,6 +94,70 @@ class InspectionPipeline:
         # Step 3: Post-process
         result = self.postprocessor.process(detections, self.camera_id)
         
-        self.logger.debug(f"Pipeline complete - Score: {result.get('quality_score', 0):.2f}")
+        self.logger.debug("Pipeline complete - Score: %.2f", result.quality_score)
+        
+        return result
+        
+    def process_stream(self, frames: Iterable[Frame]) -> Iterator[CameraResult]:
+        """
+        Process a stream of frames with the three steps overlapped.
+        
+        Each step runs as a PipelineStage on its own thread. Frames whose
+        processing fails are logged and dropped, as is the rest of the stream
+        if the frame source raises. Closing the generator early stops the
+        feeder and drains the stages before it returns.
+        
+        Args:
+            frames: Raw frames from this camera, in capture order
+            
+        Yields:
+            Processing results in capture order
+        """
+        steps = (
+            ("preprocess", self.preprocessor.process),
+            ("inference", partial(self.inference_engine.infer, camera_id=self.camera_id)),
+            ("postprocess", partial(self.postprocessor.process, camera_id=self.camera_id))
+        )
+        
+        stages = []
+        for name, step in steps:
+            upstream = stages[-1].output if stages else None
+            stages.append(PipelineStage(f"{self.camera_id}.{name}", step, input=upstream))
+            
+        for stage in stages:
+            stage.start()
+            
+        # Set when the consumer stops early; the feeder then stops reading
+        # frames and the chain is drained so every thread can exit
+        aborted = threading.Event()
+        
+        def feed() -> None:
+            try:
+                for frame in frames:
+                    if aborted.is_set():
+                        break
+                    stages[0].input.put(frame)
+            except Exception as e:
+                self.logger.error(f"Frame source failed: {str(e)}")
+            finally:
+                stages[0].input.put(PipelineStage.STOP)
+                
+        feeder = threading.Thread(target=feed, name=f"feed-{self.camera_id}", daemon=True)
+        feeder.start()
         
-        return result
\ No newline at end of file
+        output = stages[-1].output
+        result = None
+        try:
+            while True:
+                result = output.get()
+                if result is PipelineStage.STOP:
+                    break
+                yield result
+        finally:
+            aborted.set()
+            while result is not PipelineStage.STOP:
+                result = output.get()
+                
+            feeder.join()
+            for stage in stages:
+                stage.join()
\ No newline at end of file
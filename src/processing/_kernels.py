@@ -0,0 +1,59 @@
+"""
+Processing kernels - Numeric inner loops compiled with numba when available
+"""
+
+from src.utils.jit import optional_njit
+
+
+@optional_njit(cache=True, fastmath=True)
+def filter_classify_score(confidence, threshold, bounds, weights, keep, severity_idx):
+    """
+    Filter, classify and score a confidence column in one native loop.
+    
+    Positions of detections at or above threshold are written to keep and
+    their Severity values to severity_idx; both must hold len(confidence)
+    entries.
+    
+    Args:
+        confidence: Confidence values (float buffer)
+        threshold: Minimum confidence to keep a detection
+        bounds: Ascending lower confidence edges of the severities above MINOR
+        weights: Score penalty per Severity value
+        keep: Output buffer for kept positions
+        severity_idx: Output buffer for Severity values
+        
+    Returns:
+        (number of detections kept, total severity penalty)
+    """
+    count = 0
+    penalty = 0.0
+    
+    for i in range(len(confidence)):
+        c = confidence[i]
+        if c < threshold:
+            continue
+            
+        severity = 0
+        for b in range(len(bounds)):
+            if c >= bounds[b]:
+                severity = b + 1
+                
+        keep[count] = i
+        severity_idx[count] = severity
+        penalty += weights[severity]
+        count += 1
+        
+    return count, penalty
+
+
+@optional_njit(cache=True)
+def severity_histogram(severity_idx, counts):
+    """
+    Count Severity values into counts in one native loop.
+    
+    Args:
+        severity_idx: Severity values of classified detections (int8 buffer)
+        counts: Output buffer indexed by Severity value, accumulated into
+    """
+    for i in range(len(severity_idx)):
+        counts[severity_idx[i]] += 1
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""
+Defect definitions - Integer-coded defect classes and severities
+"""
+
+from enum import IntEnum
+
+
+class DefectClass(IntEnum):
+    """Defect types emitted by the inference engine"""
+    SCRATCH = 0
+    DENT = 1
+    DISCOLORATION = 2
+    CRACK = 3
+    CONTAMINATION = 4
+
+
+class Severity(IntEnum):
+    """Defect severity levels, ordered by increasing impact"""
+    MINOR = 0
+    MAJOR = 1
+    CRITICAL = 2
+
+
+# Names used at the reporting boundary, indexed by enum value
+DEFECT_CLASS_NAMES = tuple(member.name.lower() for member in DefectClass)
+SEVERITY_NAMES = tuple(member.name.lower() for member in Severity)
@@ -4,11 +4,49 @@ Inference Engine - Mock ML model inference
 
 import time
 import random
-from typing import Dict, Any, List
+from array import array
+from itertools import accumulate, chain
+from typing import Dict, Any, List, Sequence
 
+from src.processing.defects import DefectClass
 from src.utils.logger import setup_logger
 
 
+# Detections travel as a structure of arrays: one typed array per field,
+# index i across all fields describing the i-th detection.
+#   bbox        array('i')  x, y, width, height per detection (flattened)
+#   confidence  array('f')
+#   class_idx   array('b')  DefectClass value
+#   raw_score   array('f')
+
+
+def select_detections(detections: Dict[str, array],
+                      indices: Sequence[int]) -> Dict[str, array]:
+    """
+    Select a subset of detections from a structure-of-arrays batch.
+    
+    Args:
+        detections: Detection batch (one array per field)
+        indices: Positions of the detections to keep
+        
+    Returns:
+        New detection batch containing only the selected detections
+    """
+    count = len(detections["confidence"])
+    selected = {}
+    
+    for field, values in detections.items():
+        stride = len(values) // count if count else 1
+        if stride == 1:
+            selected[field] = array(values.typecode, [values[i] for i in indices])
+        else:
+            selected[field] = array(values.typecode, [
+                value for i in indices for value in values[i * stride:(i + 1) * stride]
+            ])
+            
+    return selected
+
+
 class InferenceEngine:
     """
     Mock ML inference engine for defect detection.
@@ -16,11 +54,24 @@ class InferenceEngine:
     """
     
     INFERENCE_TIME_RANGE = (0.10, 0.20)  # 100-200ms
-    DEFECT_TYPES = ["scratch", "dent", "discoloration", "crack", "contamination"]
+    BATCH_TIME_FACTOR = 0.1  # Extra inference time per additional frame in a batch
+    # Detections per frame (0-4, weighted towards fewer)
+    DETECTION_COUNTS = range(5)
+    DETECTION_CUM_WEIGHTS = list(accumulate([30, 35, 20, 10, 5]))
     
-    def __init__(self):
+    # Value ranges sampled for each bbox component
+    BBOX_X_RANGE = range(100, 1701)
+    BBOX_Y_RANGE = range(100, 901)
+    BBOX_SIZE_RANGE = range(50, 201)
+    
+    # DefectClass values; EnumMeta.__len__ is too slow to evaluate per frame
+    CLASS_INDICES = range(len(DefectClass))
+    
+    def __init__(self, simulate_latency: bool = True):
         self.logger = setup_logger(__name__)
+        self.simulate_latency = simulate_latency
         self.inference_count = 0
+        self._rng = random.Random()
         
     def infer(self, preprocessed_data: Dict[str, Any], camera_id: str) -> Dict[str, Any]:
         """
@@ -33,53 +84,77 @@ class InferenceEngine:
         Returns:
             Detection results with bounding boxes and confidences
         """
+        return self.infer_batch([preprocessed_data], [camera_id])[0]
+        
+    def infer_batch(self,
+                    preprocessed_list: List[Dict[str, Any]],
+                    camera_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Run inference on frames from several cameras in one batch.
+        
+        Args:
+            preprocessed_list: Preprocessed frame data, one per camera
+            camera_ids: Camera identifiers matching preprocessed_list
+            
+        Returns:
+            Detection results in the same order as the inputs
+        """
         start_time = time.time()
+        batch_size = len(preprocessed_list)
         
-        # Simulate GPU processing time
-        inference_time = random.uniform(*self.INFERENCE_TIME_RANGE)
-        time.sleep(inference_time)
+        # Simulate GPU processing time; batching grows it sublinearly
+        if self.simulate_latency:
+            inference_time = self._rng.uniform(*self.INFERENCE_TIME_RANGE)
+            time.sleep(inference_time * (1 + self.BATCH_TIME_FACTOR * (batch_size - 1)))
         
         # Generate mock detections
-        detections = self._generate_detections()
+        batch_detections = [self._generate_detections() for _ in range(batch_size)]
         
         elapsed_ms = (time.time() - start_time) * 1000
-        self.inference_count += 1
+        self.inference_count += batch_size
         
-        self.logger.debug(f"Inference complete for {camera_id}: "
-                         f"{len(detections)} detections ({elapsed_ms:.0f}ms)")
+        self.logger.debug("Inference complete for %s: batch of %d (%.0fms)",
+                          ", ".join(camera_ids), batch_size, elapsed_ms)
         
-        return {
-            "camera_id": camera_id,
-            "timestamp": preprocessed_data["timestamp"],
-            "detections": detections,
-            "inference_time_ms": elapsed_ms,
-            "model_version": "defect_detector_v2.1"
-        }
+        return [
+            {
+                "camera_id": camera_id,
+                "timestamp": preprocessed_data["timestamp"],
+                "trigger_timestamp": preprocessed_data["trigger_timestamp"],
+                "detections": detections,
+                "inference_time_ms": elapsed_ms,
+                "model_version": "defect_detector_v2.1"
+            }
+            for preprocessed_data, camera_id, detections in zip(
+                preprocessed_list, camera_ids, batch_detections
+            )
+        ]
         
-    def _generate_detections(self) -> List[Dict[str, Any]]:
+    def _generate_detections(self) -> Dict[str, array]:
         """
         Generate mock detection results.
         
         Returns:
-            List of detection dictionaries
+            Detection batch with one typed array per field
         """
-        # Random number of detections (0-4, weighted towards fewer)
-        num_detections = random.choices([0, 1, 2, 3, 4], weights=[30, 35, 20, 10, 5])[0]
+        # Resolve the sampling methods once per batch
+        choices = self._rng.choices
+        rand = self._rng.random
         
-        detections = []
-        for i in range(num_detections):
-            detection = {
-                "detection_id": f"det_{self.inference_count}_{i}",
-                "bbox": [
-                    random.randint(100, 1700),  # x
-                    random.randint(100, 900),   # y
-                    random.randint(50, 200),    # width
-                    random.randint(50, 200)     # height
-                ],
-                "confidence": random.uniform(0.5, 0.99),
-                "class": random.choice(self.DEFECT_TYPES),
-                "raw_score": random.uniform(0.4, 1.0)
-            }
-            detections.append(detection)
-            
-        return detections
\ No newline at end of file
+        num_detections = choices(self.DETECTION_COUNTS,
+                                 cum_weights=self.DETECTION_CUM_WEIGHTS)[0]
+        
+        # One sampling call per field for the whole batch
+        size_range = self.BBOX_SIZE_RANGE
+        xs = choices(self.BBOX_X_RANGE, k=num_detections)
+        ys = choices(self.BBOX_Y_RANGE, k=num_detections)
+        widths = choices(size_range, k=num_detections)
+        heights = choices(size_range, k=num_detections)
+        class_idx = choices(self.CLASS_INDICES, k=num_detections)
+        
+        return {
+            "bbox": array("i", chain.from_iterable(zip(xs, ys, widths, heights))),
+            "confidence": array("f", [0.5 + 0.49 * rand() for _ in range(num_detections)]),
+            "class_idx": array("b", class_idx),
+            "raw_score": array("f", [0.4 + 0.6 * rand() for _ in range(num_detections)])
+        }
\ No newline at end of file
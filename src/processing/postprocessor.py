@@ -3,129 +3,177 @@ Postprocessor - Detection result processing and quality scoring
 """
 
 import time
-from typing import Dict, Any, List
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
 
+from src.processing._kernels import filter_classify_score
+from src.processing.inference_engine import select_detections
+from src.utils.jit import HAS_NUMBA
 from src.utils.logger import setup_logger
 
 
+@dataclass
+class CameraResult:
+    """Post-processed inspection result for one camera frame"""
+    __slots__ = ("camera_id", "timestamp", "trigger_timestamp", "detections", "quality_score",
+                 "total_detections", "filtered_detections",
+                 "postprocessing_time_ms", "pipeline_time_ms")
+    
+    camera_id: str
+    timestamp: str
+    trigger_timestamp: Optional[str]  # Shutter time shared by the cycle's cameras
+    detections: Dict[str, array]  # Classified detection batch
+    quality_score: float
+    total_detections: int
+    filtered_detections: int
+    postprocessing_time_ms: float
+    pipeline_time_ms: float  # Own preprocess + post-process time, set by the controller
+
+
 class Postprocessor:
     """
     Processes inference results, filters detections, and calculates quality scores.
     """
     
+    __slots__ = ("logger",)
+    
     CONFIDENCE_THRESHOLD = 0.7
-    SEVERITY_THRESHOLDS = {
-        "minor": (0.7, 0.8),
-        "major": (0.8, 0.9),
-        "critical": (0.9, 1.0)
-    }
+    # Severity tables as parallel tuples indexed by Severity value
+    SEVERITY_LOWS = (0.7, 0.8, 0.9)  # Lower confidence edge, ascending
+    SEVERITY_WEIGHTS = (0.1, 0.3, 0.6)  # Score penalty
+    # Bisecting a confidence into the edges above MINOR yields its Severity
+    # value directly (anything below MAJOR is MINOR)
+    SEVERITY_BOUNDS = SEVERITY_LOWS[1:]
+    # Typed copies of the tables for the compiled kernel
+    KERNEL_BOUNDS = array("d", SEVERITY_BOUNDS)
+    KERNEL_WEIGHTS = array("d", SEVERITY_WEIGHTS)
+    # Below this many detections the kernel call costs more than it saves
+    KERNEL_MIN_DETECTIONS = 64
     
     def __init__(self):
         self.logger = setup_logger(__name__)
         
-    def process(self, inference_result: Dict[str, Any], camera_id: str) -> Dict[str, Any]:
+    def warmup(self) -> None:
+        """Run the detection kernel once so JIT compilation stays out of the cycles"""
+        if HAS_NUMBA:
+            self._run_kernel(array("f", [self.CONFIDENCE_THRESHOLD]))
+            
+    def process(self, inference_result: Dict[str, Any], camera_id: str) -> CameraResult:
         """
         Post-process inference results.
         
+        The detection batch in inference_result is taken over, not copied:
+        when every detection passes the threshold it is returned with a
+        severity_idx column added in place.
+        
         Args:
-            inference_result: Raw inference results
+            inference_result: Raw inference results (detections are consumed)
             camera_id: Camera identifier
             
         Returns:
             Processed results with filtered detections and quality score
         """
-        start_time = time.time()
-        
-        detections = inference_result.get("detections", [])
+        start_ns = time.perf_counter_ns()
         
-        # Filter low-confidence detections
-        filtered = self._filter_detections(detections)
+        detections = inference_result["detections"]
+        total_detections = len(detections["confidence"])
         
-        # Classify severity
-        classified = self._classify_severity(filtered)
+        # Filter, classify and score in one pass
+        classified, quality_score = self._process_detections(detections)
         
-        # Calculate quality score
-        quality_score = self._calculate_quality_score(classified)
+        elapsed_ms = (time.perf_counter_ns() - start_ns) * 1e-6
         
-        elapsed_ms = (time.time() - start_time) * 1000
+        filtered_detections = len(classified["confidence"])
         
-        self.logger.debug(f"Post-processed {camera_id}: {len(classified)}/{len(detections)} "
-                         f"detections passed threshold (Score: {quality_score:.2f})")
+        self.logger.debug("Post-processed %s: %d/%d detections passed threshold (Score: %.2f)",
+                          camera_id, filtered_detections, total_detections, quality_score)
         
-        return {
-            "camera_id": camera_id,
-            "timestamp": inference_result["timestamp"],
-            "detections": classified,
-            "quality_score": quality_score,
-            "total_detections": len(detections),
-            "filtered_detections": len(classified),
-            "postprocessing_time_ms": elapsed_ms
-        }
+        return CameraResult(
+            camera_id=camera_id,
+            timestamp=inference_result["timestamp"],
+            trigger_timestamp=inference_result["trigger_timestamp"],
+            detections=classified,
+            quality_score=quality_score,
+            total_detections=total_detections,
+            filtered_detections=filtered_detections,
+            postprocessing_time_ms=elapsed_ms,
+            pipeline_time_ms=0.0
+        )
         
-    def _filter_detections(self, detections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _process_detections(self, detections: Dict[str, array]) -> Tuple[Dict[str, array], float]:
         """
-        Filter detections below confidence threshold.
+        Filter low-confidence detections, classify severity and score the frame.
+        
+        Each confidence is read once; kept detections are classified and
+        their penalty accumulated in the same pass.
         
         Args:
-            detections: Raw detection list
+            detections: Raw detection batch (may be modified in place)
             
         Returns:
-            Filtered detection list
+            (detection batch with a severity_idx array of Severity values,
+             quality score between 0 and 1 - higher is better)
         """
-        return [
-            det for det in detections 
-            if det["confidence"] >= self.CONFIDENCE_THRESHOLD
-        ]
+        confidences = detections["confidence"]
         
-    def _classify_severity(self, detections: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """
-        Classify defect severity based on confidence.
-        
-        Args:
-            detections: Filtered detection list
+        # Fast path: frames without detections are the common case
+        if not confidences:
+            detections["severity_idx"] = array("b")
+            return detections, 1.0
             
-        Returns:
-            Detections with severity classification
-        """
-        classified = []
-        for det in detections:
-            confidence = det["confidence"]
+        if HAS_NUMBA and len(confidences) >= self.KERNEL_MIN_DETECTIONS:
+            keep, severity_idx, total_penalty = self._run_kernel(confidences)
+        else:
+            threshold = self.CONFIDENCE_THRESHOLD
+            bounds = self.SEVERITY_BOUNDS
+            weights = self.SEVERITY_WEIGHTS
             
-            # Determine severity
-            severity = "minor"
-            for sev_level, (low, high) in self.SEVERITY_THRESHOLDS.items():
-                if low <= confidence < high:
-                    severity = sev_level
-                    break
-                    
-            det_copy = det.copy()
-            det_copy["severity"] = severity
-            classified.append(det_copy)
+            keep = []
+            severity_idx = array("b")
+            total_penalty = 0.0
             
-        return classified
-        
-    def _calculate_quality_score(self, detections: List[Dict[str, Any]]) -> float:
+            for i, confidence in enumerate(confidences):
+                if confidence < threshold:
+                    continue
+                severity = bisect_right(bounds, confidence)
+                keep.append(i)
+                severity_idx.append(severity)
+                total_penalty += weights[severity]
+                
+        # Nothing dropped: reuse the caller's batch instead of copying it
+        if len(keep) == len(confidences):
+            classified = detections
+        else:
+            classified = select_detections(detections, keep)
+        classified["severity_idx"] = severity_idx
+        
+        # Cap at 0.0; rounding is left to the report
+        return classified, max(0.0, 1.0 - total_penalty)
+        
+    def _run_kernel(self, confidences: array) -> Tuple[array, array, float]:
         """
-        Calculate overall quality score for the frame.
+        Run the compiled filter/classify/score kernel over a confidence column.
         
         Args:
-            detections: Classified detection list
+            confidences: Confidence column of a detection batch
             
         Returns:
-            Quality score between 0 and 1 (higher is better)
+            (kept positions, their Severity values, total severity penalty)
         """
-        if not detections:
-            return 1.0
-            
-        # Weight by severity
-        severity_weights = {"minor": 0.1, "major": 0.3, "critical": 0.6}
-        
-        total_penalty = sum(
-            severity_weights.get(det["severity"], 0.2) 
-            for det in detections
+        n = len(confidences)
+        keep = array("q", bytes(8 * n))
+        severity_idx = array("b", bytes(n))
+        
+        count, total_penalty = filter_classify_score(
+            memoryview(confidences), self.CONFIDENCE_THRESHOLD,
+            memoryview(self.KERNEL_BOUNDS), memoryview(self.KERNEL_WEIGHTS),
+            memoryview(keep), memoryview(severity_idx)
         )
         
-        # Cap at 0.0
-        quality_score = max(0.0, 1.0 - total_penalty)
+        # Trim the preallocated outputs to the detections actually kept
+        del keep[count:]
+        del severity_idx[count:]
         
-        return round(quality_score, 3)
\ No newline at end of file
+        return keep, severity_idx, total_penalty
\ No newline at end of file
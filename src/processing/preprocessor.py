@@ -2,10 +2,14 @@
 Preprocessor - Image preprocessing and enhancement
 """
 
+import os
 import time
 import random
-from typing import Dict, Any
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List
 
+from src.core.camera import Frame
 from src.utils.logger import setup_logger
 
 
@@ -15,12 +19,28 @@ class Preprocessor:
     Mock implementation simulating real preprocessing operations.
     """
     
+    __slots__ = ("simulate_latency", "logger", "_rng", "_pool", "_pool_lock")
+    
     PROCESSING_TIME_RANGE = (0.02, 0.04)  # 20-40ms
     
-    def __init__(self):
+    def __init__(self, simulate_latency: bool = False):
+        self.simulate_latency = simulate_latency
         self.logger = setup_logger(__name__)
+        self._rng = random.Random()
+        
+        # Created by the first process_batch call, so instances that only
+        # use process() never own a pool and need no close()
+        self._pool = None
+        self._pool_lock = threading.Lock()
         
-    def process(self, frame: Dict[str, Any]) -> Dict[str, Any]:
+    def close(self) -> None:
+        """Shut down the batch worker pool, if process_batch created one"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+            
+    def process(self, frame: Frame) -> Dict[str, Any]:
         """
         Preprocess frame data.
         
@@ -30,25 +50,27 @@ class Preprocessor:
         Returns:
             Preprocessed frame data
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Simulate preprocessing operations
         self._mock_normalize(frame)
         self._mock_enhance(frame)
         
-        # Simulate processing time
-        process_time = random.uniform(*self.PROCESSING_TIME_RANGE)
-        time.sleep(process_time)
-        
-        elapsed_ms = (time.time() - start_time) * 1000
+        # Simulate processing time (off by default)
+        if self.simulate_latency:
+            low, high = self.PROCESSING_TIME_RANGE
+            time.sleep(low + (high - low) * self._rng.random())
+            
+        elapsed_ms = (time.perf_counter_ns() - start_ns) * 1e-6
         
-        self.logger.debug(f"Preprocessed frame from {frame['camera_id']} ({elapsed_ms:.0f}ms)")
+        self.logger.debug("Preprocessed frame from %s (%.0fms)", frame.camera_id, elapsed_ms)
         
         preprocessed = {
-            "camera_id": frame["camera_id"],
-            "timestamp": frame["timestamp"],
-            "frame_number": frame["frame_number"],
-            "preprocessed_data": f"<normalized_enhanced_{frame['resolution'][0]}x{frame['resolution'][1]}>",
+            "camera_id": frame.camera_id,
+            "timestamp": frame.timestamp,
+            "trigger_timestamp": frame.trigger_timestamp,
+            "frame_number": frame.frame_number,
+            "preprocessed_data": f"<normalized_enhanced_{frame.resolution[0]}x{frame.resolution[1]}>",
             "preprocessing_applied": [
                 "normalization",
                 "noise_reduction",
@@ -59,12 +81,32 @@ class Preprocessor:
         
         return preprocessed
         
-    def _mock_normalize(self, frame: Dict[str, Any]) -> None:
+    def process_batch(self, frames: List[Frame]) -> List[Dict[str, Any]]:
+        """
+        Preprocess several frames in parallel.
+        
+        Args:
+            frames: Raw frames, e.g. one per camera
+            
+        Returns:
+            Preprocessed frame data in the same order as frames
+        """
+        pool = self._pool
+        if pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=os.cpu_count(),
+                                                    thread_name_prefix="preprocess")
+                pool = self._pool
+                
+        return list(pool.map(self.process, frames))
+        
+    def _mock_normalize(self, frame: Frame) -> None:
         """Mock normalization operation"""
         # In real implementation: convert to float, normalize to [0, 1]
         pass
         
-    def _mock_enhance(self, frame: Dict[str, Any]) -> None:
+    def _mock_enhance(self, frame: Frame) -> None:
         """Mock enhancement operation"""
         # In real implementation: apply filters, adjust contrast
         pass
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+Clock utility - Fast UTC timestamp formatting
+"""
+
+import time
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last call; swapped
+# as one tuple so concurrent callers always see a consistent pair
+_cached_second = (-1, "")
+
+
+def iso_utc_now() -> str:
+    """
+    Return the current UTC time as an ISO 8601 string with microseconds.
+    
+    Equivalent to datetime.utcnow().isoformat() + "Z" without allocating a
+    datetime; the date/time prefix is only re-formatted once per second.
+    
+    Returns:
+        Timestamp such as "2024-01-06T10:30:45.123456Z"
+    """
+    global _cached_second
+    
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached, prefix = _cached_second
+    
+    if seconds != cached:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+        _cached_second = (seconds, prefix)
+        
+    return f"{prefix}.{nanos // 1000:06d}Z"
@@ -0,0 +1,34 @@
+"""
+JIT utility - Optional numba compilation for numeric kernels
+"""
+
+from typing import Any, Callable
+
+try:
+    import numba
+except ImportError:  # numba is an optional accelerator, never required
+    numba = None
+
+
+HAS_NUMBA = numba is not None
+
+
+def optional_njit(**options: Any) -> Callable[[Callable], Callable]:
+    """
+    Decorator compiling a function with numba.njit when numba is installed.
+    
+    Without numba the function is returned unchanged, so kernels must also
+    be valid plain Python.
+    
+    Args:
+        **options: Keyword arguments forwarded to numba.njit (e.g. cache=True)
+        
+    Returns:
+        Decorator
+    """
+    def decorate(func: Callable) -> Callable:
+        if numba is None:
+            return func
+        return numba.njit(**options)(func)
+        
+    return decorate
@@ -4,13 +4,29 @@ Logging utility - Structured logging for inspection system
 
 import logging
 import sys
-from typing import Optional
+import threading
+from typing import Dict, Optional
 
 
 # Global logger configuration
-_loggers = {}
+_loggers: Dict[str, logging.Logger] = {}
+_setup_lock = threading.Lock()
 _log_level = logging.INFO
 
+# Format: timestamp - name - level - message
+# One formatter shared by every handler
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)-30s - %(levelname)-8s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+# The format above uses no thread, process or source location fields, so
+# skip collecting them (and the caller stack walk) for every record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
 
 def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     """
@@ -23,30 +39,33 @@ def setup_logger(name: str, level: Optional[int] = None) -> logging.Logger:
     Returns:
         Configured logger instance
     """
-    if name in _loggers:
-        return _loggers[name]
+    # Warm path: loggers are memoized by name, one lock-free dict lookup
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
         
-    logger = logging.getLogger(name)
-    logger.setLevel(level or _log_level)
-    
-    # Avoid duplicate handlers
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setLevel(level or _log_level)
+    # Cold path: configure under a lock so concurrent first calls for the
+    # same name cannot both attach a handler
+    with _setup_lock:
+        logger = _loggers.get(name)
+        if logger is not None:
+            return logger
+            
+        logger = logging.getLogger(name)
+        logger.setLevel(level or _log_level)
         
-        # Format: timestamp - name - level - message
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)-30s - %(levelname)-8s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        # Avoid duplicate handlers
+        if not logger.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setLevel(level or _log_level)
+            handler.setFormatter(_FORMATTER)
+            logger.addHandler(handler)
+            
+        # Prevent propagation to avoid duplicate logs
+        logger.propagate = False
         
-    # Prevent propagation to avoid duplicate logs
-    logger.propagate = False
-    
-    _loggers[name] = logger
-    return logger
+        _loggers[name] = logger
+        return logger
 
 
 def set_log_level(level: int) -> None:
@@ -59,7 +78,7 @@ def set_log_level(level: int) -> None:
     global _log_level
     _log_level = level
     
-    for logger in _loggers.values():
+    for logger in list(_loggers.values()):
         logger.setLevel(level)
         for handler in logger.handlers:
             handler.setLevel(level)
\ No newline at end of file
@@ -3,29 +3,146 @@ Metrics Collector - Performance and operational metrics
 """
 
 import threading
+from array import array
 from typing import Dict, Any, List
-from collections import defaultdict
 
 from src.utils.logger import setup_logger
 
 
+class MetricsShard:
+    """
+    Metrics recorded by a single thread.
+    
+    Only the owning thread writes to a shard, so recording needs no lock;
+    the collector merges all shards when a summary is requested.
+    """
+    
+    __slots__ = ("generation", "capacity", "cycle_times", "quality_scores",
+                 "defect_counts", "write_idx", "cycle_count", "sum_cycle_time",
+                 "min_cycle_time", "max_cycle_time", "sum_quality", "sum_defects",
+                 "pass_count", "fail_count", "camera_failures", "total_failures")
+    
+    def __init__(self, capacity: int, generation: int):
+        self.generation = generation
+        self.capacity = capacity
+        
+        # Recent per-cycle history in fixed-size ring buffers, allocated on
+        # the first record_cycle so failure-only shards never pay for them;
+        # lifetime statistics come from the running aggregates instead
+        self.cycle_times = None
+        self.quality_scores = None
+        self.defect_counts = None
+        self.write_idx = 0
+        
+        self.cycle_count = 0
+        self.sum_cycle_time = 0.0
+        self.min_cycle_time = float("inf")
+        self.max_cycle_time = float("-inf")
+        self.sum_quality = 0.0
+        self.sum_defects = 0
+        self.pass_count = 0
+        self.fail_count = 0
+        self.camera_failures = array("q")  # Indexed by registered camera index
+        self.total_failures = 0
+        
+    def record_cycle(self, cycle_time: float, quality_score: float,
+                     defects: int, decision: str) -> None:
+        """Record one completed cycle"""
+        if self.cycle_times is None:
+            capacity = self.capacity
+            self.cycle_times = array("d", bytes(8 * capacity))
+            self.quality_scores = array("d", bytes(8 * capacity))
+            self.defect_counts = array("q", bytes(8 * capacity))
+            
+        i = self.write_idx
+        self.cycle_times[i] = cycle_time
+        self.quality_scores[i] = quality_score
+        self.defect_counts[i] = defects
+        self.write_idx = (i + 1) % self.capacity
+        
+        self.cycle_count += 1
+        self.sum_cycle_time += cycle_time
+        if cycle_time < self.min_cycle_time:
+            self.min_cycle_time = cycle_time
+        if cycle_time > self.max_cycle_time:
+            self.max_cycle_time = cycle_time
+        self.sum_quality += quality_score
+        self.sum_defects += defects
+        
+        if decision == "PASS":
+            self.pass_count += 1
+        elif decision == "FAIL":
+            self.fail_count += 1
+            
+    def recent_count(self) -> int:
+        """Number of valid entries in the ring buffers"""
+        return min(self.cycle_count, self.capacity)
+        
+    def record_camera_failure(self, camera_index: int) -> None:
+        """Record a capture failure for a registered camera"""
+        failures = self.camera_failures
+        if camera_index >= len(failures):
+            failures.extend([0] * (camera_index + 1 - len(failures)))
+        failures[camera_index] += 1
+
+
 class MetricsCollector:
     """
     Thread-safe metrics collection for inspection system.
     Tracks cycle performance, defects, and errors.
+    
+    Each recording thread writes to its own MetricsShard without taking a
+    lock; the lock is only held to register a new shard and to merge the
+    shards in get_summary. A summary is a snapshot and may miss records
+    still being written.
     """
     
-    def __init__(self):
+    __slots__ = ("logger", "_lock", "capacity", "_local", "_shards", "_generation",
+                 "_camera_index", "_camera_names")
+    
+    HISTORY_CAPACITY = 1024  # Most recent cycles kept per shard
+    
+    def __init__(self, capacity: int = HISTORY_CAPACITY):
         self.logger = setup_logger(__name__)
         self._lock = threading.Lock()
+        self.capacity = capacity
+        self._local = threading.local()
+        self._shards: List[MetricsShard] = []
+        self._generation = 0  # Bumped by reset() to retire existing shards
         
-        # Metrics storage
-        self.cycle_times = []
-        self.decisions = []
-        self.defect_counts = []
-        self.quality_scores = []
-        self.camera_failures = defaultdict(int)
-        self.total_failures = 0
+        # Camera ids mapped to dense indices into the shards' failure counts
+        self._camera_index: Dict[str, int] = {}
+        self._camera_names: List[str] = []
+        
+    def register_camera(self, camera_id: str) -> int:
+        """
+        Assign a camera a dense index for failure counting.
+        
+        Args:
+            camera_id: Camera identifier
+            
+        Returns:
+            Index of the camera (unchanged if already registered)
+        """
+        with self._lock:
+            index = self._camera_index.get(camera_id)
+            if index is None:
+                index = len(self._camera_names)
+                self._camera_names.append(camera_id)
+                self._camera_index[camera_id] = index
+            return index
+            
+    def _shard(self) -> MetricsShard:
+        """Return the calling thread's shard, registering a new one if needed"""
+        shard = getattr(self._local, "shard", None)
+        if shard is not None and shard.generation == self._generation:
+            return shard
+            
+        with self._lock:
+            shard = MetricsShard(self.capacity, self._generation)
+            self._shards.append(shard)
+        self._local.shard = shard
+        return shard
         
     def record_cycle(self, report: Dict[str, Any]) -> None:
         """
@@ -34,12 +151,13 @@ class MetricsCollector:
         Args:
             report: Inspection report
         """
-        with self._lock:
-            self.cycle_times.append(report['total_time_ms'])
-            self.decisions.append(report['decision'])
-            self.defect_counts.append(report['defects_found'])
-            self.quality_scores.append(report['aggregated_score'])
-            
+        self._shard().record_cycle(
+            report['total_time_ms'],
+            report['aggregated_score'],
+            report['defects_found'],
+            report['decision']
+        )
+        
     def record_camera_failure(self, camera_id: str) -> None:
         """
         Record camera capture failure.
@@ -47,14 +165,15 @@ class MetricsCollector:
         Args:
             camera_id: Identifier of failed camera
         """
-        with self._lock:
-            self.camera_failures[camera_id] += 1
-            
+        index = self._camera_index.get(camera_id)
+        if index is None:
+            index = self.register_camera(camera_id)
+        self._shard().record_camera_failure(index)
+        
     def record_failure(self) -> None:
         """Record general cycle failure"""
-        with self._lock:
-            self.total_failures += 1
-            
+        self._shard().total_failures += 1
+        
     def get_summary(self) -> Dict[str, Any]:
         """
         Get summary statistics.
@@ -63,33 +182,96 @@ class MetricsCollector:
             Dictionary of aggregated metrics
         """
         with self._lock:
-            total_cycles = len(self.decisions)
-            successful = total_cycles
+            shards = list(self._shards)
+            
+        total_cycles = sum(shard.cycle_count for shard in shards)
+        successful = total_cycles
+        
+        if not total_cycles:
+            return self._empty_summary()
             
-            if not total_cycles:
-                return self._empty_summary()
+        passes = sum(shard.pass_count for shard in shards)
+        fails = sum(shard.fail_count for shard in shards)
+        total_defects = sum(shard.sum_defects for shard in shards)
+        
+        # Shard arrays may grow while being read; size to the longest copy
+        shard_failures = [shard.camera_failures.tolist() for shard in shards]
+        failure_counts = [0] * max(map(len, shard_failures), default=0)
+        for counts in shard_failures:
+            for index, count in enumerate(counts):
+                failure_counts[index] += count
                 
-            passes = self.decisions.count("PASS")
-            fails = self.decisions.count("FAIL")
+        # A camera is registered before any shard counts it, so names read
+        # after the counts cover every index seen above
+        with self._lock:
+            camera_names = list(self._camera_names)
+        camera_failures = {
+            camera_id: count
+            for camera_id, count in zip(camera_names, failure_counts) if count
+        }
+        
+        summary = {
+            "total_cycles": total_cycles,
+            "successful_cycles": successful,
+            "failed_cycles": sum(shard.total_failures for shard in shards),
+            "pass_count": passes,
+            "fail_count": fails,
+            "pass_rate": passes / total_cycles * 100,
+            "avg_cycle_time": sum(shard.sum_cycle_time for shard in shards) / total_cycles,
+            "min_cycle_time": min(shard.min_cycle_time for shard in shards),
+            "max_cycle_time": max(shard.max_cycle_time for shard in shards),
+            "avg_quality_score": sum(shard.sum_quality for shard in shards) / total_cycles,
+            "total_defects": total_defects,
+            "avg_defects_per_cycle": total_defects / total_cycles,
+            "camera_failures": camera_failures
+        }
+        
+        return summary
+        
+    def get_recent_summary(self) -> Dict[str, Any]:
+        """
+        Get statistics over the recent cycle window.
+        
+        The window holds the last HISTORY_CAPACITY cycles recorded by each
+        thread, so it tracks current behaviour rather than the whole run.
+        
+        Returns:
+            Dictionary of windowed metrics
+        """
+        with self._lock:
+            shards = list(self._shards)
             
-            summary = {
-                "total_cycles": total_cycles,
-                "successful_cycles": successful,
-                "failed_cycles": self.total_failures,
-                "pass_count": passes,
-                "fail_count": fails,
-                "pass_rate": (passes / total_cycles * 100) if total_cycles > 0 else 0,
-                "avg_cycle_time": sum(self.cycle_times) / len(self.cycle_times) if self.cycle_times else 0,
-                "min_cycle_time": min(self.cycle_times) if self.cycle_times else 0,
-                "max_cycle_time": max(self.cycle_times) if self.cycle_times else 0,
-                "avg_quality_score": sum(self.quality_scores) / len(self.quality_scores) if self.quality_scores else 0,
-                "total_defects": sum(self.defect_counts),
-                "avg_defects_per_cycle": sum(self.defect_counts) / len(self.defect_counts) if self.defect_counts else 0,
-                "camera_failures": dict(self.camera_failures)
+        cycle_times = []
+        quality_scores = []
+        defect_counts = []
+        for shard in shards:
+            n = shard.recent_count()
+            if n:
+                # Order within the window does not matter for these statistics
+                cycle_times.extend(shard.cycle_times[:n])
+                quality_scores.extend(shard.quality_scores[:n])
+                defect_counts.extend(shard.defect_counts[:n])
+                
+        window = len(cycle_times)
+        if not window:
+            return {
+                "window_cycles": 0,
+                "avg_cycle_time": 0.0,
+                "min_cycle_time": 0.0,
+                "max_cycle_time": 0.0,
+                "avg_quality_score": 0.0,
+                "avg_defects_per_cycle": 0.0
             }
             
-            return summary
-            
+        return {
+            "window_cycles": window,
+            "avg_cycle_time": sum(cycle_times) / window,
+            "min_cycle_time": min(cycle_times),
+            "max_cycle_time": max(cycle_times),
+            "avg_quality_score": sum(quality_scores) / window,
+            "avg_defects_per_cycle": sum(defect_counts) / window
+        }
+        
     def _empty_summary(self) -> Dict[str, Any]:
         """Return empty summary structure"""
         return {
@@ -111,9 +293,6 @@ class MetricsCollector:
     def reset(self) -> None:
         """Reset all metrics"""
         with self._lock:
-            self.cycle_times.clear()
-            self.decisions.clear()
-            self.defect_counts.clear()
-            self.quality_scores.clear()
-            self.camera_failures.clear()
-            self.total_failures = 0
\ No newline at end of file
+            # Threads notice the new generation and register fresh shards
+            self._generation += 1
+            self._shards = []
\ No newline at end of file